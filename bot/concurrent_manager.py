@@ -4,6 +4,7 @@ Concurrent game management and resource monitoring for the Telegram Word Game Bo
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Set, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -191,13 +192,11 @@ class ResourceMonitor:
     def get_inactive_games(self, active_games: Dict[int, GameState], timeout_minutes: int = 30) -> List[int]:
         """Get list of inactive game chat IDs."""
         cutoff_time = datetime.now() - timedelta(minutes=timeout_minutes)
-        inactive_games = []
         
-        for chat_id, metrics in self.game_metrics.items():
-            if metrics.last_activity < cutoff_time:
-                inactive_games.append(chat_id)
-        
-        return inactive_games
+        return [
+            chat_id for chat_id, metrics in self.game_metrics.items()
+            if metrics.last_activity < cutoff_time
+        ]
     
     def add_resource_warning(self, warning: str) -> None:
         """Add a resource warning."""
@@ -263,8 +262,18 @@ class ConcurrentGameManager:
     def register_game_start(self, chat_id: int, game_state: GameState) -> None:
         """Register a new game start."""
         self.resource_monitor.update_game_metrics(chat_id, game_state)
+        self._check_resource_usage()
+    
+    def register_games_bulk(self, games: Dict[int, GameState]) -> None:
+        """Register several game starts at once, checking resource usage only once."""
+        for chat_id, game_state in games.items():
+            self.resource_monitor.update_game_metrics(chat_id, game_state)
         
-        # Check resource status
+        if games:
+            self._check_resource_usage()
+    
+    def _check_resource_usage(self) -> None:
+        """Record a warning if the number of tracked games is high."""
         active_count = len(self.resource_monitor.game_metrics)
         status = self.resource_monitor.get_resource_status(active_count, 0)
         
@@ -389,6 +398,8 @@ class ChatIsolationManager:
     def __init__(self):
         self.chat_locks: Dict[int, asyncio.Lock] = {}
         self.chat_activity: Dict[int, datetime] = {}
+        # Callers holding or waiting for each chat's lock through hold_chat_lock
+        self.chat_users: Dict[int, int] = {}
     
     async def get_chat_lock(self, chat_id: int) -> asyncio.Lock:
         """Get or create a lock for a specific chat."""
@@ -398,20 +409,45 @@ class ChatIsolationManager:
         self.chat_activity[chat_id] = datetime.now()
         return self.chat_locks[chat_id]
     
+    @asynccontextmanager
+    async def hold_chat_lock(self, chat_id: int):
+        """Hold a chat's lock, counting the caller as a user while it waits and runs."""
+        self.chat_users[chat_id] = self.chat_users.get(chat_id, 0) + 1
+        try:
+            lock = await self.get_chat_lock(chat_id)
+            async with lock:
+                yield
+        finally:
+            self.chat_users[chat_id] -= 1
+            if not self.chat_users[chat_id]:
+                del self.chat_users[chat_id]
+    
     async def execute_with_chat_lock(self, chat_id: int, operation, *args, **kwargs):
         """Execute an operation with chat-specific locking."""
-        lock = await self.get_chat_lock(chat_id)
-        
-        async with lock:
+        async with self.hold_chat_lock(chat_id):
             return await operation(*args, **kwargs)
     
+    def _chat_in_use(self, chat_id: int) -> bool:
+        """Check whether a chat's lock is held or awaited through hold_chat_lock."""
+        return chat_id in self.chat_users
+    
+    def release_chat(self, chat_id: int) -> None:
+        """Forget the lock and activity record for a chat whose game has ended."""
+        # Dropping a busy lock would let the next caller run alongside its waiters;
+        # keep it and leave it to cleanup_old_locks
+        if self._chat_in_use(chat_id):
+            return
+        
+        self.chat_locks.pop(chat_id, None)
+        self.chat_activity.pop(chat_id, None)
+    
     def cleanup_old_locks(self, hours: int = 24) -> int:
         """Clean up locks for inactive chats."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
         old_chats = []
         
         for chat_id, last_activity in self.chat_activity.items():
-            if last_activity < cutoff_time:
+            if last_activity < cutoff_time and not self._chat_in_use(chat_id):
                 old_chats.append(chat_id)
         
         for chat_id in old_chats:
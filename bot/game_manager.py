@@ -179,35 +179,37 @@ class GameManager:
         Returns:
             Tuple of (GameResult, error_message)
         """
-        # Get game state
-        game_state = self.get_game_status(chat_id)
-        
-        # Process word using word processor
-        result, error_message = await self.word_processor.process_word_submission(
-            game_state, player_id, word
-        )
-        
-        # If word is valid, update game state
-        if result == GameResult.VALID_WORD:
-            # Update game state
-            normalized_word = word.strip().lower()
-            self.word_processor.get_next_game_state(normalized_word, game_state)
+        # Serialize submissions per chat only, so games never wait on each other
+        async with self.chat_isolation.hold_chat_lock(chat_id):
+            # Get game state
+            game_state = self.get_game_status(chat_id)
             
-            # Cancel current timer if it exists
-            if game_state.timer_task and not game_state.timer_task.done():
-                game_state.timer_task.cancel()
-                game_state.timer_task = None
+            # Process word using word processor
+            result, error_message = await self.word_processor.process_word_submission(
+                game_state, player_id, word
+            )
             
-            # Register activity with concurrent manager
-            self.concurrent_manager.register_game_activity(chat_id, game_state, words_submitted=1)
+            # If word is valid, update game state
+            if result == GameResult.VALID_WORD:
+                # Update game state
+                normalized_word = word.strip().lower()
+                self.word_processor.get_next_game_state(normalized_word, game_state)
+                
+                # Cancel current timer if it exists
+                if game_state.timer_task and not game_state.timer_task.done():
+                    game_state.timer_task.cancel()
+                    game_state.timer_task = None
+                
+                # Register activity with concurrent manager
+                self.concurrent_manager.register_game_activity(chat_id, game_state, words_submitted=1)
+                
+                logger.info(f"Valid word '{normalized_word}' submitted by player {player_id} in chat {chat_id}. "
+                           f"Next: letter={game_state.current_letter}, length={game_state.required_length}")
+            else:
+                # Register error activity
+                self.concurrent_manager.register_game_activity(chat_id, game_state, errors=1)
             
-            logger.info(f"Valid word '{normalized_word}' submitted by player {player_id} in chat {chat_id}. "
-                       f"Next: letter={game_state.current_letter}, length={game_state.required_length}")
-        else:
-            # Register error activity
-            self.concurrent_manager.register_game_activity(chat_id, game_state, errors=1)
-        
-        return result, error_message
+            return result, error_message
     
     async def handle_timeout(self, chat_id: int) -> Optional[Player]:
         """Handle turn timeout - eliminate the current player."""
@@ -278,6 +280,7 @@ class GameManager:
         
         # Register with concurrent manager
         self.concurrent_manager.register_game_end(chat_id)
+        self.chat_isolation.release_chat(chat_id)
         
         logger.info(f"Stopped game in chat {chat_id}")
         return True
@@ -6,11 +6,11 @@ import asyncio
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the word game."""
     user_id: int
@@ -25,7 +25,7 @@ class Player:
         return self.first_name
 
 
-@dataclass
+@dataclass(slots=True)
 class GameConfig:
     """Configuration parameters for the word game."""
     turn_timeout: int = 30
@@ -103,6 +103,25 @@ class GameState:
                 return True
         return False
 
+    def _bulk_remove(self, user_ids: Set[int]) -> int:
+        """Remove all listed players in a single pass. Returns how many were removed."""
+        kept = []
+        removed_before_current = 0
+        for i, player in enumerate(self.players):
+            if player.user_id not in user_ids:
+                kept.append(player)
+            elif i < self.current_player_index:
+                removed_before_current += 1
+        
+        removed = len(self.players) - len(kept)
+        self.players[:] = kept
+        
+        # Same index rules as remove_player: keep pointing at the same turn slot
+        self.current_player_index -= removed_before_current
+        if self.current_player_index >= len(self.players):
+            self.current_player_index = 0
+        return removed
+
     def add_player(self, player: Player) -> bool:
         """Add a player to the game. Returns True if player was added."""
         # Check if player already exists
@@ -4,7 +4,7 @@ Timer management system for turn timeouts in the Telegram Word Game Bot.
 
 import asyncio
 import logging
-from typing import Callable, Optional, Dict, Any
+from typing import Awaitable, Callable, Optional, Dict, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -13,8 +13,16 @@ logger = logging.getLogger(__name__)
 class TimerManager:
     """Manages turn timers using asyncio tasks."""
     
-    def __init__(self):
+    def __init__(self, sleep: Optional[Callable[[float], Awaitable[Any]]] = None):
+        """
+        Initialize the timer manager.
+        
+        Args:
+            sleep: Optional coroutine function used to wait between timer
+                events; defaults to asyncio.sleep
+        """
         self._active_timers: Dict[int, asyncio.Task] = {}
+        self._sleep = sleep or asyncio.sleep
     
     async def start_turn_timer(
         self,
@@ -84,7 +92,8 @@ class TimerManager:
                 except asyncio.CancelledError:
                     pass
             
-            del self._active_timers[chat_id]
+            # The timer's own cleanup may already have removed the mapping
+            self._active_timers.pop(chat_id, None)
             logger.debug(f"Cancelled timer for chat {chat_id}")
             return True
         
@@ -144,41 +153,37 @@ class TimerManager:
             warning_times: List of warning times in seconds before timeout
         """
         try:
-            start_time = datetime.now()
+            # Elapsed time follows the scheduled sleeps, so the timer wakes
+            # only for its warnings and the final timeout
             elapsed = 0
             
-            # Sort warning times in descending order
-            warning_times_sorted = sorted(warning_times, reverse=True)
-            warnings_sent = set()
-            
-            while elapsed < timeout_seconds:
-                # Check for warnings
-                if warning_callback:
-                    for warning_time in warning_times_sorted:
-                        remaining = timeout_seconds - elapsed
+            if warning_callback:
+                # Sort warning times in descending order
+                for warning_time in sorted(set(warning_times), reverse=True):
+                    fire_at = max(0, timeout_seconds - warning_time)
+                    if warning_time <= 0 or fire_at >= timeout_seconds:
+                        continue
+                    
+                    if fire_at > elapsed:
+                        await self._sleep(fire_at - elapsed)
+                        elapsed = fire_at
+                    
+                    remaining = timeout_seconds - elapsed
+                    try:
+                        # Call warning callback
+                        if asyncio.iscoroutinefunction(warning_callback):
+                            await warning_callback(chat_id, int(remaining))
+                        else:
+                            warning_callback(chat_id, int(remaining))
                         
-                        if (remaining <= warning_time and 
-                            warning_time not in warnings_sent and
-                            remaining > 0):
-                            
-                            try:
-                                # Call warning callback
-                                if asyncio.iscoroutinefunction(warning_callback):
-                                    await warning_callback(chat_id, int(remaining))
-                                else:
-                                    warning_callback(chat_id, int(remaining))
-                                
-                                warnings_sent.add(warning_time)
-                                logger.debug(f"Sent {remaining}s warning for chat {chat_id}")
-                                
-                            except Exception as e:
-                                logger.error(f"Error in warning callback for chat {chat_id}: {e}")
-                
-                # Sleep for 1 second
-                await asyncio.sleep(1)
-                
-                # Update elapsed time
-                elapsed = (datetime.now() - start_time).total_seconds()
+                        logger.debug(f"Sent {remaining}s warning for chat {chat_id}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error in warning callback for chat {chat_id}: {e}")
+            
+            # Sleep out the rest of the turn
+            if timeout_seconds > elapsed:
+                await self._sleep(timeout_seconds - elapsed)
             
             # Timer expired - call timeout callback
             try:
@@ -208,17 +213,19 @@ class TimerManager:
 class GameTimerManager:
     """High-level timer manager specifically for game turns."""
     
-    def __init__(self, game_manager, announcement_callback=None):
+    def __init__(self, game_manager, announcement_callback=None, sleep=None):
         """
         Initialize the game timer manager.
         
         Args:
             game_manager: The GameManager instance
             announcement_callback: Optional callback for sending announcements
+            sleep: Optional coroutine function the turn timers wait with;
+                defaults to asyncio.sleep
         """
         self.game_manager = game_manager
         self.announcement_callback = announcement_callback
-        self.timer_manager = TimerManager()
+        self.timer_manager = TimerManager(sleep=sleep)
     
     async def start_turn_timer(self, chat_id: int) -> bool:
         """
@@ -0,0 +1,127 @@
+"""
+Batching queue that feeds raw webhook updates to the Telegram Word Game Bot.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateBatcher:
+    """Queues raw updates and processes them in small concurrent batches."""
+    
+    def __init__(
+        self,
+        handler: Callable[[Dict], Awaitable[Any]],
+        max_queue: int = 1024,
+        batch_size: int = 8,
+        batch_window: float = 0.005,
+        max_inflight: int = 64
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            handler: Coroutine function that processes one raw update
+            max_queue: Updates that may wait for processing before submit() refuses more
+            batch_size: Maximum number of updates gathered into one batch
+            batch_window: Seconds to keep collecting after the first update of a batch
+            max_inflight: Maximum number of updates processed concurrently
+        """
+        self._handler = handler
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+        self._slots = asyncio.Semaphore(max_inflight)
+        self._pending: Set[asyncio.Task] = set()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._accepting = True
+    
+    def submit(self, update_data: Dict) -> bool:
+        """Queue a raw update. Returns False if it was refused (full or stopping)."""
+        if not self._accepting:
+            return False
+        try:
+            self._queue.put_nowait(update_data)
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        self._drain_task = asyncio.create_task(self._drain())
+    
+    async def stop(self) -> None:
+        """Refuse new updates, finish every accepted one, then stop the consumer."""
+        self._accepting = False
+        
+        # task_done() runs after an update is processed, so this also covers in-flight batches
+        await self._queue.join()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        
+        if self._drain_task:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+    
+    async def next_batch(self) -> List[Dict]:
+        """Wait for one update, then collect more until the batch is full or the window closes.
+        
+        Each update is taken from the queue only after an in-flight slot is held
+        for it, so saturated handlers leave updates queued and submit() refuses.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._get_with_slot()]
+        deadline = loop.time() + self._batch_window
+        
+        while len(batch) < self._batch_size and not self._slots.locked():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await self._get_with_slot(remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def _get_with_slot(self, timeout: Optional[float] = None) -> Dict:
+        """Hold an in-flight slot, then take the next update from the queue."""
+        await self._slots.acquire()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    async def _drain(self) -> None:
+        """Hand queued updates to the handler batch by batch."""
+        while True:
+            batch = await self.next_batch()
+            task = asyncio.create_task(self._process_batch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+    
+    async def _process_batch(self, batch: List[Dict]) -> None:
+        """Process a batch concurrently, logging failures per update."""
+        results = await asyncio.gather(
+            *(self._process_one(update_data) for update_data in batch),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error processing update", exc_info=result)
+    
+    async def _process_one(self, update_data: Dict) -> None:
+        """Process one update, then free the in-flight slot taken for it."""
+        try:
+            await self._handler(update_data)
+        finally:
+            self._slots.release()
+            self._queue.task_done()
@@ -26,9 +26,11 @@ class WordValidationError(Exception):
 class WordProcessor:
     """Handles word processing and validation logic."""
     
+    # Letters-only check, compiled once for all processors
+    _ALPHA = re.compile(r'\A[A-Za-z]+\Z', re.ASCII)
+    
     def __init__(self, word_validator: validators.WordValidator):
         self.word_validator = word_validator
-        self._word_pattern = re.compile(r'^[a-zA-Z]+$')
     
     async def process_word_submission(
         self, 
@@ -121,7 +123,7 @@ class WordProcessor:
             )
         
         # Check if word contains only letters
-        if not self._word_pattern.match(normalized):
+        if not self._ALPHA.match(normalized):
             return normalized, WordValidationError(
                 GameResult.INVALID_WORD, 
                 "Words can only contain letters (no numbers, spaces, or special characters)"
@@ -0,0 +1,30 @@
+"""
+Gunicorn settings for the webhook bot (webhook_bot:app).
+"""
+
+import os
+
+# Render provides the port to listen on
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+
+# Game state lives in process memory, so keep a single worker unless it is externalized
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+# Uvicorn runs the app on uvloop whenever it is installed
+worker_class = "uvicorn.workers.UvicornWorker"
+
+keepalive = 75
+# UvicornWorker sends no heartbeat until app startup finishes, and a fresh
+# container downloads NLTK WordNet data during startup, so allow well over
+# webhook_bot.STARTUP_TIMEOUT before the master kills a silent worker
+timeout = 300
+
+# No max_requests recycling: restarting the only worker would drop every game in progress
+
+# Import the app once in the master; workers fork from it and share its pages
+preload_app = True
+
+
+def on_starting(server):
+    """Register the Telegram webhook once, before any worker starts."""
+    import webhook_bot
+    webhook_bot.register_webhook_once()
@@ -7,6 +7,7 @@ Runs different types of tests with appropriate configurations.
 import sys
 import subprocess
 import argparse
+import importlib.util
 import time
 from pathlib import Path
 
@@ -33,6 +34,15 @@ def run_command(cmd, description):
     return result.returncode == 0
 
 
+def parallel_args():
+    """Return pytest-xdist arguments when the plugin is installed."""
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    
+    # Keep each module on one worker so module-scoped fixtures stay shared
+    return ["-n", "auto", "--dist=loadfile"]
+
+
 def run_unit_tests():
     """Run all unit tests."""
     unit_test_files = [
@@ -46,7 +56,8 @@ def run_unit_tests():
         "tests/test_error_handler.py",
         "tests/test_concurrent_manager.py",
         "tests/test_telegram_bot.py",
-        "tests/test_turn_management.py"
+        "tests/test_turn_management.py",
+        "tests/test_update_batcher.py"
     ]
     
     # Filter to only existing files
@@ -60,7 +71,7 @@ def run_unit_tests():
         "-v",
         "--tb=short",
         "--durations=10"
-    ]
+    ] + parallel_args()
     
     return run_command(cmd, "Unit Tests")
 
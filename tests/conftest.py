@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import asyncio
+import pytest_asyncio
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the performance benchmarks on uvloop when it is installed."""
+    if uvloop is not None and item.path.name == "test_performance.py":
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def cancel_leftover_tasks():
+    """Cancel tasks a test left running on the shared event loop."""
+    yield
+    
+    current = asyncio.current_task()
+    leftovers = [task for task in asyncio.all_tasks() if task is not current]
+    for task in leftovers:
+        task.cancel()
+    await asyncio.gather(*leftovers, return_exceptions=True)
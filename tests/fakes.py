@@ -0,0 +1,34 @@
+"""
+Lightweight test doubles shared by the unit tests.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+
+class FakeGameManager:
+    """Stand-in for GameManager exposing only the methods the bot calls."""
+
+    def __init__(self):
+        # Synchronous queries
+        self.get_game_status = MagicMock()
+        self.get_winner = MagicMock()
+        self.get_word_hints = MagicMock()
+        self.get_difficulty_assessment = MagicMock()
+        self.get_turn_time_remaining = MagicMock()
+        self.format_word_feedback = MagicMock()
+        self.get_active_game_count = MagicMock()
+        self.get_total_player_count = MagicMock()
+
+        # Coroutines
+        self.start_game = AsyncMock()
+        self.create_waiting_game = AsyncMock()
+        self.add_player_to_game = AsyncMock()
+        self.start_actual_game = AsyncMock()
+        self.process_word = AsyncMock()
+        self.handle_timeout = AsyncMock()
+        self.stop_game = AsyncMock()
+
+    def reset_mock(self, **kwargs) -> None:
+        """Reset every stubbed method, mirroring Mock.reset_mock."""
+        for method in vars(self).values():
+            method.reset_mock(**kwargs)
@@ -292,6 +292,25 @@ class TestConcurrentGameManager:
         
         assert 12345 in concurrent_manager.resource_monitor.game_metrics
     
+    def test_register_games_bulk(self, concurrent_manager):
+        """Test registering several game starts at once."""
+        games = {
+            chat_id: GameState(
+                chat_id=chat_id,
+                current_letter="A",
+                required_length=1,
+                current_player_index=0,
+                players=[Player(1, "user1", "User1")]
+            )
+            for chat_id in (111, 222, 333, 444)
+        }
+        
+        concurrent_manager.register_games_bulk(games)
+        
+        assert set(concurrent_manager.resource_monitor.game_metrics) == set(games)
+        # 4/5 games is HIGH usage; the warning is recorded once, not per game
+        assert len(concurrent_manager.resource_monitor.resource_warnings) == 1
+    
     def test_register_game_activity(self, concurrent_manager):
         """Test registering game activity."""
         players = [Player(1, "user1", "User1")]
@@ -477,6 +496,49 @@ class TestChatIsolationManager:
         assert 12345 not in isolation_manager.chat_locks
         assert 67890 in isolation_manager.chat_locks
     
+    @pytest.mark.asyncio
+    async def test_release_chat(self, isolation_manager):
+        """Test releasing the lock of a finished chat."""
+        await isolation_manager.get_chat_lock(12345)
+        
+        isolation_manager.release_chat(12345)
+        isolation_manager.release_chat(12345)  # Releasing twice is harmless
+        
+        assert 12345 not in isolation_manager.chat_locks
+        assert 12345 not in isolation_manager.get_active_chats()
+    
+    @pytest.mark.asyncio
+    async def test_release_chat_keeps_busy_lock(self, isolation_manager):
+        """Test that a lock still held or awaited survives release_chat."""
+        release = asyncio.Event()
+        order = []
+        
+        async def holding_operation():
+            await release.wait()
+            order.append("holding")
+        
+        async def queued_operation():
+            order.append("queued")
+        
+        holding = asyncio.create_task(isolation_manager.execute_with_chat_lock(12345, holding_operation))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(isolation_manager.execute_with_chat_lock(12345, queued_operation))
+        await asyncio.sleep(0)
+        lock = isolation_manager.chat_locks[12345]
+        
+        # The game ends while an operation holds the lock and another waits on it
+        isolation_manager.release_chat(12345)
+        assert await isolation_manager.get_chat_lock(12345) is lock
+        
+        release.set()
+        await asyncio.gather(holding, queued)
+        assert order == ["holding", "queued"]
+        
+        # Once idle, the lock can be released
+        isolation_manager.release_chat(12345)
+        assert 12345 not in isolation_manager.chat_locks
+        assert isolation_manager.chat_users == {}
+    
     def test_get_active_chats(self, isolation_manager):
         """Test getting active chat list."""
         isolation_manager.chat_activity[12345] = datetime.now()
@@ -286,6 +286,7 @@ class TestWordValidationEdgeCases:
         await game_manager.stop_game(chat_id)
 
 
+@pytest.mark.slow
 class TestTimerEdgeCases:
     """Edge case tests for timer system."""
     
@@ -134,6 +134,39 @@ class TestGameManager:
         assert game_state.required_length == initial_length
         assert game_state.current_player_index == initial_player
     
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_in_chat_are_serialized(self, game_manager, test_players, mock_validator):
+        """Test that a second submission in a chat waits for the first and sees its result."""
+        chat_id = 12345
+        release = asyncio.Event()
+        
+        async def blocking_validate(word):
+            if not release.is_set():
+                await release.wait()
+            return True
+        
+        mock_validator.validate_word.side_effect = blocking_validate
+        
+        game_state = await game_manager.start_game(chat_id, test_players)
+        first_word = f"{game_state.current_letter.lower()}at"
+        
+        # Player 1's word is still being validated when player 2 answers it
+        first = asyncio.create_task(game_manager.process_word(chat_id, test_players[0].user_id, first_word))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(game_manager.process_word(chat_id, test_players[1].user_id, "to"))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        
+        release.set()
+        first_result, _ = await first
+        second_result, error = await second
+        
+        assert first_result == GameResult.VALID_WORD
+        assert second_result == GameResult.VALID_WORD
+        assert error is None
+        assert game_state.current_letter == "O"
+        assert game_state.current_player_index == 2
+    
     @pytest.mark.asyncio
     async def test_wrong_player_turn_rejected(self, game_manager, test_players):
         """Test that word submission from wrong player is rejected."""
@@ -246,6 +246,7 @@ class TestCompleteGameFlow:
         final_state = game_manager.get_game_status(chat_id)
         assert final_state is None or not final_state.is_active
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_timer_integration_with_game_flow(self, game_system):
         """Test timer integration with complete game flow."""
@@ -3,54 +3,149 @@ Unit tests for timer management system.
 """
 
 import asyncio
+import heapq
+import itertools
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from datetime import datetime
 
 from bot.timer_manager import TimerManager, GameTimerManager
-from bot.game_manager import GameManager
 from bot.models import Player, GameConfig
+from tests.fakes import FakeGameManager
+
+# Shared players; use dataclasses.replace for per-test variations
+ALICE = Player(user_id=1, username="player1", first_name="Alice")
+
+# Shared turn configuration; timers only read it
+_DEFAULT_CFG = GameConfig(turn_timeout=30, timeout_warnings=[10, 5])
+
+
+class ACall:
+    """Minimal awaitable call recorder, lighter than AsyncMock."""
+    
+    def __init__(self, side_effect=None, return_value=None):
+        self.calls = []
+        self.side_effect = side_effect
+        self.return_value = return_value
+    
+    def __call__(self, *args, **kwargs):
+        """Record the call and return an already-resolved future.
+        
+        A plain method keeps the recorder usable by callers that only await
+        coroutine functions, as the timer callbacks do.
+        """
+        self.calls.append((args, kwargs))
+        
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            self.side_effect(*args, **kwargs)
+        
+        result = asyncio.get_running_loop().create_future()
+        result.set_result(self.return_value)
+        return result
+    
+    @property
+    def call_count(self) -> int:
+        """Number of recorded calls."""
+        return len(self.calls)
+    
+    def assert_called_once(self) -> None:
+        """Assert the recorder was called exactly once."""
+        assert self.call_count == 1, f"Expected one call, got {self.calls}"
+    
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        """Assert the only recorded call used these arguments."""
+        assert self.calls == [(args, kwargs)], f"Expected one call with {(args, kwargs)}, got {self.calls}"
+    
+    def assert_not_called(self) -> None:
+        """Assert the recorder was never called."""
+        assert not self.calls, f"Expected no calls, got {self.calls}"
+
+
+# Tests here share one event loop per module, so clean up after each of them
+pytestmark = pytest.mark.usefixtures("cancel_leftover_tasks")
+
+
+class VirtualClock:
+    """Virtual time source that timers sleep on and tests drive explicitly."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self._sleepers = []
+        self._sequence = itertools.count()
+    
+    async def sleep(self, seconds: float) -> None:
+        """Suspend until the clock has been advanced past the deadline."""
+        wakeup = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.now + seconds, next(self._sequence), wakeup))
+        await wakeup
+    
+    async def run_until(self, awaitable, timeout: float = 1.0):
+        """Move time forward in deadline order until the awaitable finishes."""
+        task = asyncio.ensure_future(awaitable)
+        await self._settle()
+        
+        while not task.done() and self._sleepers:
+            deadline, _, wakeup = heapq.heappop(self._sleepers)
+            self.now = deadline
+            if not wakeup.done():
+                wakeup.set_result(None)
+            await self._settle()
+        
+        return await asyncio.wait_for(task, timeout=timeout)
+    
+    @staticmethod
+    async def _settle() -> None:
+        """Let woken tasks run until they block again."""
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    """Create a virtual clock for driving timers."""
+    return VirtualClock()
 
 
 class TestTimerManager:
     """Test cases for TimerManager class."""
     
     @pytest.fixture
-    def timer_manager(self):
+    def timer_manager(self, clock):
         """Create a TimerManager instance for testing."""
-        return TimerManager()
+        return TimerManager(sleep=clock.sleep)
     
-    @pytest.mark.asyncio
     async def test_start_and_cancel_timer(self, timer_manager):
         """Test starting and cancelling a timer."""
         chat_id = 12345
-        timeout_callback = AsyncMock()
+        timeout_callback = ACall()
         
         # Start timer
         timer_task = await timer_manager.start_turn_timer(
             chat_id=chat_id,
-            timeout_seconds=2,
+            timeout_seconds=0.1,
             timeout_callback=timeout_callback
         )
         
-        assert timer_manager.is_timer_active(chat_id) == True
+        assert timer_manager.is_timer_active(chat_id)
         assert timer_manager.get_active_timer_count() == 1
         
         # Cancel timer
         cancelled = await timer_manager.cancel_timer(chat_id)
         
-        assert cancelled == True
-        assert timer_manager.is_timer_active(chat_id) == False
+        assert cancelled
+        assert not timer_manager.is_timer_active(chat_id)
         assert timer_manager.get_active_timer_count() == 0
         
         # Callback should not have been called
         timeout_callback.assert_not_called()
     
-    @pytest.mark.asyncio
-    async def test_timer_timeout_calls_callback(self, timer_manager):
+    async def test_timer_timeout_calls_callback(self, timer_manager, clock):
         """Test that timer calls timeout callback when it expires."""
         chat_id = 12345
-        timeout_callback = AsyncMock()
+        timed_out = asyncio.Event()
+        timeout_callback = ACall(side_effect=lambda *_: timed_out.set())
         
         # Start short timer
         await timer_manager.start_turn_timer(
@@ -60,18 +155,19 @@ class TestTimerManager:
         )
         
         # Wait for timer to expire
-        await asyncio.sleep(0.2)
+        await clock.run_until(timed_out.wait())
         
         # Callback should have been called
         timeout_callback.assert_called_once_with(chat_id)
-        assert timer_manager.is_timer_active(chat_id) == False
+        assert not timer_manager.is_timer_active(chat_id)
     
-    @pytest.mark.asyncio
-    async def test_warning_callbacks(self, timer_manager):
+    async def test_warning_callbacks(self, timer_manager, clock):
         """Test that warning callbacks are called at correct times."""
         chat_id = 12345
-        timeout_callback = AsyncMock()
-        warning_callback = AsyncMock()
+        warned = asyncio.Event()
+        timed_out = asyncio.Event()
+        timeout_callback = ACall(side_effect=lambda *_: timed_out.set())
+        warning_callback = ACall(side_effect=lambda *_: warned.set())
         
         # Start timer with warnings
         await timer_manager.start_turn_timer(
@@ -83,19 +179,20 @@ class TestTimerManager:
         )
         
         # Wait for warnings and timeout
-        await asyncio.sleep(0.4)
+        await clock.run_until(asyncio.gather(warned.wait(), timed_out.wait()))
         
         # Should have called warning callback twice and timeout once
         assert warning_callback.call_count >= 1  # At least one warning
         timeout_callback.assert_called_once_with(chat_id)
     
-    @pytest.mark.asyncio
-    async def test_multiple_concurrent_timers(self, timer_manager):
+    async def test_multiple_concurrent_timers(self, timer_manager, clock):
         """Test managing multiple concurrent timers."""
         chat_id_1 = 12345
         chat_id_2 = 67890
-        callback_1 = AsyncMock()
-        callback_2 = AsyncMock()
+        expired_1 = asyncio.Event()
+        expired_2 = asyncio.Event()
+        callback_1 = ACall(side_effect=lambda *_: expired_1.set())
+        callback_2 = ACall(side_effect=lambda *_: expired_2.set())
         
         # Start two timers
         await timer_manager.start_turn_timer(chat_id_1, 0.1, callback_1)
@@ -104,51 +201,50 @@ class TestTimerManager:
         assert timer_manager.get_active_timer_count() == 2
         
         # Wait for first timer to expire
-        await asyncio.sleep(0.15)
+        await clock.run_until(expired_1.wait())
         
         # First callback should be called, second should not
         callback_1.assert_called_once()
         callback_2.assert_not_called()
         
         # Wait for second timer
-        await asyncio.sleep(0.1)
+        await clock.run_until(expired_2.wait())
         callback_2.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_replace_existing_timer(self, timer_manager):
+    async def test_replace_existing_timer(self, timer_manager, clock):
         """Test that starting a new timer cancels the existing one."""
         chat_id = 12345
-        callback_1 = AsyncMock()
-        callback_2 = AsyncMock()
+        expired = asyncio.Event()
+        callback_1 = ACall()
+        callback_2 = ACall(side_effect=lambda *_: expired.set())
         
         # Start first timer
-        await timer_manager.start_turn_timer(chat_id, 1.0, callback_1)
+        await timer_manager.start_turn_timer(chat_id, 0.5, callback_1)
         
         # Start second timer (should cancel first)
-        await timer_manager.start_turn_timer(chat_id, 0.1, callback_2)
+        await timer_manager.start_turn_timer(chat_id, 0.05, callback_2)
         
         # Wait for second timer to expire
-        await asyncio.sleep(0.2)
+        await clock.run_until(expired.wait())
         
         # Only second callback should be called
         callback_1.assert_not_called()
         callback_2.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_cancel_nonexistent_timer(self, timer_manager):
         """Test cancelling a timer that doesn't exist."""
         result = await timer_manager.cancel_timer(99999)
-        assert result == False
+        assert not result
     
-    @pytest.mark.asyncio
-    async def test_cleanup_completed_timers(self, timer_manager):
+    async def test_cleanup_completed_timers(self, timer_manager, clock):
         """Test cleanup of completed timer tasks."""
         chat_id = 12345
-        callback = AsyncMock()
+        expired = asyncio.Event()
+        callback = ACall(side_effect=lambda *_: expired.set())
         
         # Start and let timer complete
         await timer_manager.start_turn_timer(chat_id, 0.1, callback)
-        await asyncio.sleep(0.2)
+        await clock.run_until(expired.wait())
         
         # Timer should be completed but still tracked
         assert len(timer_manager._active_timers) == 1
@@ -157,15 +253,14 @@ class TestTimerManager:
         await timer_manager.cleanup_completed_timers()
         assert len(timer_manager._active_timers) == 0
     
-    @pytest.mark.asyncio
     async def test_cancel_all_timers(self, timer_manager):
         """Test cancelling all active timers."""
-        callback_1 = AsyncMock()
-        callback_2 = AsyncMock()
+        callback_1 = ACall()
+        callback_2 = ACall()
         
         # Start multiple timers
-        await timer_manager.start_turn_timer(12345, 1.0, callback_1)
-        await timer_manager.start_turn_timer(67890, 1.0, callback_2)
+        await timer_manager.start_turn_timer(12345, 0.1, callback_1)
+        await timer_manager.start_turn_timer(67890, 0.1, callback_2)
         
         assert timer_manager.get_active_timer_count() == 2
         
@@ -176,22 +271,23 @@ class TestTimerManager:
         callback_1.assert_not_called()
         callback_2.assert_not_called()
     
-    @pytest.mark.asyncio
-    async def test_error_handling_in_callbacks(self, timer_manager):
+    async def test_error_handling_in_callbacks(self, timer_manager, clock):
         """Test that errors in callbacks don't crash the timer."""
         chat_id = 12345
+        expired = asyncio.Event()
         
         def failing_callback(chat_id):
+            expired.set()
             raise Exception("Test error")
         
         # Start timer with failing callback
         await timer_manager.start_turn_timer(chat_id, 0.1, failing_callback)
         
         # Wait for timer to expire - should not raise exception
-        await asyncio.sleep(0.2)
+        await clock.run_until(expired.wait())
         
         # Timer should be cleaned up despite callback error
-        assert timer_manager.is_timer_active(chat_id) == False
+        assert not timer_manager.is_timer_active(chat_id)
 
 
 class TestGameTimerManager:
@@ -199,18 +295,18 @@ class TestGameTimerManager:
     
     @pytest.fixture
     def mock_game_manager(self):
-        """Create a mock GameManager."""
-        return MagicMock(spec=GameManager)
+        """Create a fake GameManager."""
+        return FakeGameManager()
     
     @pytest.fixture
     def mock_announcement_callback(self):
         """Create a mock announcement callback."""
-        return AsyncMock()
+        return ACall()
     
     @pytest.fixture
-    def game_timer_manager(self, mock_game_manager, mock_announcement_callback):
+    def game_timer_manager(self, mock_game_manager, mock_announcement_callback, clock):
         """Create a GameTimerManager instance for testing."""
-        return GameTimerManager(mock_game_manager, mock_announcement_callback)
+        return GameTimerManager(mock_game_manager, mock_announcement_callback, sleep=clock.sleep)
     
     @pytest.fixture
     def mock_game_state(self):
@@ -218,16 +314,13 @@ class TestGameTimerManager:
         game_state = MagicMock()
         game_state.is_active = True
         game_state.timer_task = None
-        game_state.game_config = GameConfig(turn_timeout=30, timeout_warnings=[10, 5])
+        game_state.game_config = _DEFAULT_CFG
         
         # Mock players
-        current_player = Player(user_id=1, username="player1", first_name="Alice")
-        next_player = Player(user_id=2, username="player2", first_name="Bob")
-        game_state.get_current_player.return_value = current_player
+        game_state.get_current_player.return_value = ALICE
         
         return game_state
     
-    @pytest.mark.asyncio
     async def test_start_turn_timer_success(self, game_timer_manager, mock_game_manager, mock_game_state):
         """Test successfully starting a turn timer."""
         chat_id = 12345
@@ -235,31 +328,23 @@ class TestGameTimerManager:
         
         result = await game_timer_manager.start_turn_timer(chat_id)
         
-        assert result == True
+        assert result
         assert mock_game_state.timer_task is not None
     
-    @pytest.mark.asyncio
-    async def test_start_timer_no_active_game(self, game_timer_manager, mock_game_manager):
-        """Test starting timer when no active game exists."""
+    @pytest.mark.parametrize("has_game,is_active", [
+        (False, False),
+        (True, False),
+    ], ids=["no_game", "inactive_game"])
+    async def test_start_timer_without_active_game(self, game_timer_manager, mock_game_manager, mock_game_state, has_game, is_active):
+        """Test starting timer when no game exists or the game is inactive."""
         chat_id = 12345
-        mock_game_manager.get_game_status.return_value = None
-        
-        result = await game_timer_manager.start_turn_timer(chat_id)
-        
-        assert result == False
-    
-    @pytest.mark.asyncio
-    async def test_start_timer_inactive_game(self, game_timer_manager, mock_game_manager, mock_game_state):
-        """Test starting timer for inactive game."""
-        chat_id = 12345
-        mock_game_state.is_active = False
-        mock_game_manager.get_game_status.return_value = mock_game_state
+        mock_game_state.is_active = is_active
+        mock_game_manager.get_game_status.return_value = mock_game_state if has_game else None
         
         result = await game_timer_manager.start_turn_timer(chat_id)
         
-        assert result == False
+        assert not result
     
-    @pytest.mark.asyncio
     async def test_cancel_turn_timer(self, game_timer_manager, mock_game_manager, mock_game_state):
         """Test cancelling a turn timer."""
         chat_id = 12345
@@ -271,15 +356,14 @@ class TestGameTimerManager:
         # Cancel timer
         result = await game_timer_manager.cancel_turn_timer(chat_id)
         
-        assert result == True
+        assert result
         assert mock_game_state.timer_task is None
     
-    @pytest.mark.asyncio
     async def test_timeout_handling(self, game_timer_manager, mock_game_manager, mock_game_state, mock_announcement_callback):
         """Test timeout handling calls game manager and sends announcements."""
         chat_id = 12345
         mock_game_manager.get_game_status.return_value = mock_game_state
-        mock_game_manager.handle_timeout = AsyncMock()
+        mock_game_manager.handle_timeout = ACall(return_value=MagicMock())
         
         # Simulate timeout
         await game_timer_manager._handle_timeout(chat_id)
@@ -290,7 +374,6 @@ class TestGameTimerManager:
         # Should call announcement callback
         mock_announcement_callback.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_warning_handling(self, game_timer_manager, mock_game_manager, mock_game_state, mock_announcement_callback):
         """Test warning handling sends announcements."""
         chat_id = 12345
@@ -308,7 +391,6 @@ class TestGameTimerManager:
             remaining_seconds=remaining_seconds
         )
     
-    @pytest.mark.asyncio
     async def test_cleanup(self, game_timer_manager):
         """Test cleanup cancels all timers."""
         # Start a timer
@@ -316,7 +398,7 @@ class TestGameTimerManager:
         mock_game_state = MagicMock()
         mock_game_state.is_active = True
         mock_game_state.timer_task = None
-        mock_game_state.game_config = GameConfig()
+        mock_game_state.game_config = _DEFAULT_CFG
         
         game_timer_manager.game_manager.get_game_status.return_value = mock_game_state
         
@@ -327,7 +409,6 @@ class TestGameTimerManager:
         
         assert game_timer_manager.timer_manager.get_active_timer_count() == 0
     
-    @pytest.mark.asyncio
     async def test_error_handling_in_timeout(self, game_timer_manager, mock_game_manager):
         """Test error handling in timeout callback."""
         chat_id = 12345
@@ -336,7 +417,6 @@ class TestGameTimerManager:
         # Should not raise exception
         await game_timer_manager._handle_timeout(chat_id)
     
-    @pytest.mark.asyncio
     async def test_error_handling_in_warning(self, game_timer_manager, mock_announcement_callback):
         """Test error handling in warning callback."""
         chat_id = 12345
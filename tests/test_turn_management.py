@@ -3,18 +3,35 @@ Unit tests for turn management and player queue functionality.
 """
 
 import pytest
+from collections import deque
+from dataclasses import replace
 from datetime import datetime, timedelta
-from unittest.mock import patch
 
 from bot.models import GameState, Player, GameConfig
 
+# Template players, copied per test so mutations stay isolated
+_PLAYER_TEMPLATES = tuple(
+    Player(user_id=i, username=f"player{i}", first_name=name)
+    for i, name in enumerate(["Alice", "Bob", "Charlie", "Diana"], 1)
+)
+
+
+def frozen_datetime(moment: datetime) -> type:
+    """Build a datetime class whose now() always returns the given moment."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment
+    
+    return FrozenDatetime
+
 
 class TestTurnManagement:
     """Test cases for turn management functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def game_config(self):
-        """Create a test game configuration."""
+        """Create a test game configuration shared by the session."""
         return GameConfig(
             turn_timeout=30,
             min_word_length=1,
@@ -23,13 +40,8 @@ class TestTurnManagement:
     
     @pytest.fixture
     def test_players(self):
-        """Create test players."""
-        return [
-            Player(user_id=1, username="player1", first_name="Alice"),
-            Player(user_id=2, username="player2", first_name="Bob"),
-            Player(user_id=3, username="player3", first_name="Charlie"),
-            Player(user_id=4, username="player4", first_name="Diana")
-        ]
+        """Create fresh copies of the template players for each test."""
+        return [replace(player) for player in _PLAYER_TEMPLATES]
     
     @pytest.fixture
     def game_state(self, test_players, game_config):
@@ -67,51 +79,34 @@ class TestTurnManagement:
         
         assert empty_game.get_current_player() is None
     
-    def test_advance_turn(self, game_state, test_players):
-        """Test advancing to the next player's turn."""
+    @pytest.mark.parametrize("start,expected", [(0, 1), (1, 2), (2, 3), (3, 0)])
+    def test_advance_turn(self, game_state, test_players, start, expected):
+        """Test advancing to the next player's turn, wrapping after the last player."""
+        game_state.current_player_index = start
         initial_time = game_state.turn_start_time
         
         # Advance turn
         game_state.advance_turn()
         
         # Should move to next player
-        assert game_state.current_player_index == 1
-        assert game_state.get_current_player() == test_players[1]
+        assert game_state.current_player_index == expected
+        assert game_state.get_current_player() == test_players[expected]
         
         # Turn start time should be updated
         assert game_state.turn_start_time != initial_time
         assert game_state.turn_start_time is not None
     
-    def test_advance_turn_wraps_around(self, game_state, test_players):
-        """Test that advancing turn wraps around to first player."""
-        # Set to last player
-        game_state.current_player_index = len(test_players) - 1
+    @pytest.mark.parametrize("start,expected", [(0, 1), (1, 2), (2, 3), (3, 0)])
+    def test_get_next_player(self, game_state, test_players, start, expected):
+        """Test getting next player without advancing, wrapping after the last player."""
+        game_state.current_player_index = start
         
-        # Advance turn
-        game_state.advance_turn()
-        
-        # Should wrap to first player
-        assert game_state.current_player_index == 0
-        assert game_state.get_current_player() == test_players[0]
-    
-    def test_get_next_player(self, game_state, test_players):
-        """Test getting next player without advancing."""
-        # Should return second player
         next_player = game_state.get_next_player()
-        assert next_player == test_players[1]
+        assert next_player == test_players[expected]
         
         # Current player should not change
-        assert game_state.current_player_index == 0
-        assert game_state.get_current_player() == test_players[0]
-    
-    def test_get_next_player_wraps_around(self, game_state, test_players):
-        """Test that get_next_player wraps around."""
-        # Set to last player
-        game_state.current_player_index = len(test_players) - 1
-        
-        # Next player should be first
-        next_player = game_state.get_next_player()
-        assert next_player == test_players[0]
+        assert game_state.current_player_index == start
+        assert game_state.get_current_player() == test_players[start]
     
     def test_get_player_turn_order(self, game_state, test_players):
         """Test getting players in turn order."""
@@ -125,6 +120,15 @@ class TestTurnManagement:
         expected = test_players[2:] + test_players[:2]
         assert turn_order == expected
     
+    def test_get_player_turn_order_many_turns(self, game_state, test_players):
+        """Test turn order stays a rotation of the players across many turns."""
+        expected = deque(test_players)
+        
+        for _ in range(1000):
+            game_state.advance_turn()
+            expected.rotate(-1)
+            assert game_state.get_player_turn_order() == list(expected)
+    
     def test_add_player_success(self, game_state, game_config):
         """Test successfully adding a player to the game."""
         new_player = Player(user_id=5, username="player5", first_name="Eve")
@@ -202,17 +206,44 @@ class TestTurnManagement:
         assert game_state.should_end_game() == False
         
         # Remove players until only 1 remains
-        game_state.remove_player(test_players[0].user_id)
-        game_state.remove_player(test_players[1].user_id)
-        game_state.remove_player(test_players[2].user_id)
+        removed = game_state._bulk_remove({p.user_id for p in test_players[:3]})
+        assert removed == 3
         
         # With 1 player, game should end
         assert game_state.should_end_game() == True
         
         # With 0 players, game should end
-        game_state.remove_player(test_players[3].user_id)
+        game_state._bulk_remove({test_players[3].user_id})
         assert game_state.should_end_game() == True
     
+    def test_bulk_remove_matches_sequential_removal(self, game_state, test_players):
+        """Test that bulk removal leaves the same turn index as removing one by one."""
+        sequential = replace(game_state, players=list(game_state.players))
+        game_state.current_player_index = sequential.current_player_index = 2
+        
+        for player in test_players[1:3]:
+            sequential.remove_player(player.user_id)
+        game_state._bulk_remove({p.user_id for p in test_players[1:3]})
+        
+        assert game_state.players == sequential.players
+        assert game_state.current_player_index == sequential.current_player_index
+    
+    def test_add_player_after_players_replaced(self, game_state, test_players):
+        """Test duplicate detection after the players list is reassigned."""
+        game_state.players = test_players[2:]
+        
+        assert game_state.add_player(test_players[0]) == True
+        assert game_state.add_player(test_players[2]) == False
+        assert game_state.players == [test_players[2], test_players[3], test_players[0]]
+    
+    def test_add_player_after_in_place_replacement(self, game_state, test_players):
+        """Test duplicate detection after a player is swapped in place."""
+        newcomer = Player(user_id=5, username="player5", first_name="Eve")
+        game_state.players[1] = newcomer
+        
+        assert game_state.add_player(Player(user_id=5, username="player5", first_name="Eve")) == False
+        assert [p.user_id for p in game_state.players] == [1, 5, 3, 4]
+    
     def test_get_active_players(self, game_state, test_players):
         """Test getting only active players."""
         # All players active initially
@@ -285,23 +316,22 @@ class TestTurnManagement:
         assert game_state.current_player_index == 1
         assert game_state.get_current_player() == test_players[1]
     
-    def test_turn_timing_functions(self, game_state):
+    def test_turn_timing_functions(self, game_state, monkeypatch):
         """Test turn timing calculation functions."""
         # Mock current time
         start_time = datetime.now()
         game_state.turn_start_time = start_time
         
-        with patch('bot.models.datetime') as mock_datetime:
-            # Mock 15 seconds elapsed
-            mock_datetime.now.return_value = start_time + timedelta(seconds=15)
-            
-            # Test duration calculation
-            duration = game_state.get_turn_duration()
-            assert duration == 15.0
-            
-            # Test remaining time calculation (30s timeout - 15s elapsed = 15s remaining)
-            remaining = game_state.get_remaining_turn_time()
-            assert remaining == 15.0
+        # Freeze the clock 15 seconds later
+        monkeypatch.setattr('bot.models.datetime', frozen_datetime(start_time + timedelta(seconds=15)))
+        
+        # Test duration calculation
+        duration = game_state.get_turn_duration()
+        assert duration == 15.0
+        
+        # Test remaining time calculation (30s timeout - 15s elapsed = 15s remaining)
+        remaining = game_state.get_remaining_turn_time()
+        assert remaining == 15.0
     
     def test_turn_timing_no_start_time(self, game_state):
         """Test turn timing when no start time is set."""
@@ -310,17 +340,16 @@ class TestTurnManagement:
         assert game_state.get_turn_duration() is None
         assert game_state.get_remaining_turn_time() is None
     
-    def test_remaining_time_never_negative(self, game_state):
+    def test_remaining_time_never_negative(self, game_state, monkeypatch):
         """Test that remaining time never goes negative."""
         start_time = datetime.now()
         game_state.turn_start_time = start_time
         
-        with patch('bot.models.datetime') as mock_datetime:
-            # Mock 45 seconds elapsed (more than 30s timeout)
-            mock_datetime.now.return_value = start_time + timedelta(seconds=45)
-            
-            remaining = game_state.get_remaining_turn_time()
-            assert remaining == 0.0  # Should not be negative
+        # Freeze the clock 45 seconds later (more than 30s timeout)
+        monkeypatch.setattr('bot.models.datetime', frozen_datetime(start_time + timedelta(seconds=45)))
+        
+        remaining = game_state.get_remaining_turn_time()
+        assert remaining == 0.0  # Should not be negative
 
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+"""
+Unit tests for the webhook update batching queue.
+"""
+
+import asyncio
+import pytest
+
+from bot.update_batcher import UpdateBatcher
+
+
+class TestUpdateBatcher:
+    """Test cases for UpdateBatcher class."""
+    
+    @pytest.fixture
+    def processed(self):
+        """Collect the updates handed to the handler."""
+        return []
+    
+    @pytest.fixture
+    def handler(self, processed):
+        """Create a handler that records each update."""
+        async def handle(update_data):
+            processed.append(update_data)
+        return handle
+    
+    async def test_batch_limited_to_batch_size(self, handler):
+        """Test that a batch never holds more than batch_size updates."""
+        batcher = UpdateBatcher(handler, batch_size=8, batch_window=1.0)
+        for i in range(20):
+            assert batcher.submit({"update_id": i})
+        
+        batch = await batcher.next_batch()
+        
+        assert batch == [{"update_id": i} for i in range(8)]
+    
+    async def test_batch_collects_updates_within_window(self, handler):
+        """Test that updates arriving inside the window join the batch."""
+        batcher = UpdateBatcher(handler, batch_size=8, batch_window=0.5)
+        batcher.submit({"update_id": 1})
+        asyncio.get_running_loop().call_later(0.01, batcher.submit, {"update_id": 2})
+        
+        batch = await batcher.next_batch()
+        
+        # The window stays open, so the batch closes only after it expires
+        assert batch == [{"update_id": 1}, {"update_id": 2}]
+    
+    async def test_batch_closes_when_window_expires(self, handler):
+        """Test that updates arriving after the window start the next batch."""
+        batcher = UpdateBatcher(handler, batch_size=8, batch_window=0.01)
+        batcher.submit({"update_id": 1})
+        asyncio.get_running_loop().call_later(0.1, batcher.submit, {"update_id": 2})
+        
+        first = await batcher.next_batch()
+        second = await batcher.next_batch()
+        
+        assert first == [{"update_id": 1}]
+        assert second == [{"update_id": 2}]
+    
+    def test_submit_refused_when_queue_full(self, handler):
+        """Test that a full queue refuses updates so the webhook can answer 429."""
+        batcher = UpdateBatcher(handler, max_queue=2)
+        
+        assert batcher.submit({"update_id": 1}) == True
+        assert batcher.submit({"update_id": 2}) == True
+        assert batcher.submit({"update_id": 3}) == False
+    
+    async def test_submit_refused_when_handlers_saturated(self, processed):
+        """Test that busy handlers leave updates queued until submit() refuses more."""
+        release = asyncio.Event()
+        
+        async def slow_handler(update_data):
+            await release.wait()
+            processed.append(update_data)
+        
+        batcher = UpdateBatcher(slow_handler, max_queue=10, batch_window=0.01, max_inflight=2)
+        batcher.start()
+        
+        accepted = 0
+        for i in range(100):
+            if batcher.submit({"update_id": i}):
+                accepted += 1
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+        
+        # Two updates hold the in-flight slots and the rest fill the queue
+        assert accepted == 12
+        assert batcher.submit({"update_id": 100}) == False
+        
+        release.set()
+        await asyncio.wait_for(batcher.stop(), timeout=1.0)
+        assert len(processed) == 12
+    
+    async def test_stop_processes_accepted_updates(self, handler, processed):
+        """Test that stopping finishes every queued update before returning."""
+        batcher = UpdateBatcher(handler, batch_size=2, batch_window=0.01)
+        for i in range(5):
+            batcher.submit({"update_id": i})
+        batcher.start()
+        
+        await batcher.stop()
+        
+        assert sorted(u["update_id"] for u in processed) == list(range(5))
+        assert batcher.submit({"update_id": 5}) == False
+    
+    async def test_stop_waits_for_in_flight_updates(self, processed):
+        """Test that stopping waits for batches that are still being processed."""
+        release = asyncio.Event()
+        
+        async def slow_handler(update_data):
+            await release.wait()
+            processed.append(update_data)
+        
+        batcher = UpdateBatcher(slow_handler, batch_window=0.01)
+        batcher.submit({"update_id": 1})
+        batcher.start()
+        await asyncio.sleep(0.05)
+        
+        stop_task = asyncio.create_task(batcher.stop())
+        await asyncio.sleep(0.01)
+        assert not stop_task.done()
+        
+        release.set()
+        await asyncio.wait_for(stop_task, timeout=1.0)
+        assert processed == [{"update_id": 1}]
+    
+    async def test_handler_error_does_not_block_batch(self, processed):
+        """Test that a failing update is logged and the rest are still processed."""
+        async def flaky_handler(update_data):
+            if update_data["update_id"] == 1:
+                raise ValueError("bad update")
+            processed.append(update_data)
+        
+        batcher = UpdateBatcher(flaky_handler, batch_window=0.01)
+        for i in range(3):
+            batcher.submit({"update_id": i})
+        batcher.start()
+        
+        await asyncio.wait_for(batcher.stop(), timeout=1.0)
+        
+        assert sorted(u["update_id"] for u in processed) == [0, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,18 +4,66 @@ Webhook-enabled Telegram Word Game Bot for Render deployment.
 """
 
 import os
-import sys
 import asyncio
 import logging
+from dataclasses import dataclass
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify
-from telegram import Update
-import threading
+from quart import Quart, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+from telegram import Bot, Update
 
 # Load environment variables
 load_dotenv()
 
+# Bot modules are imported up front so a preloading Gunicorn master shares them with workers
+# bot.config reads and checks the token at import; it is the single source for it
+from bot.config import config as bot_config
+from bot.models import GameConfig
+from bot.word_validators import create_word_validator
+from bot.game_manager import GameManager
+from bot.telegram_bot import create_telegram_bot
+from bot.update_batcher import UpdateBatcher
+
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """Deployment settings, read once from the environment at import."""
+    token: str
+    hostname: str
+    max_inflight: int
+    queue_size: int
+    batch_size: int
+    batch_window: float
+
+    @classmethod
+    def from_env(cls) -> 'Env':
+        """Create Env from environment variables and the shared bot configuration."""
+        return cls(
+            token=bot_config.telegram_bot_token,
+            hostname=os.getenv('RENDER_EXTERNAL_HOSTNAME', 'localhost'),
+            max_inflight=int(os.getenv('MAX_INFLIGHT', '64')),
+            queue_size=int(os.getenv('UPDATE_QUEUE_SIZE', '1024')),
+            batch_size=int(os.getenv('UPDATE_BATCH_SIZE', '8')),
+            batch_window=int(os.getenv('UPDATE_BATCH_WINDOW_MS', '5')) / 1000
+        )
+
+ENV = Env.from_env()
+
+# Bot token doubles as the secret webhook path
+WEBHOOK_PATH = f"/{ENV.token}"
+WEBHOOK_URL = f"https://{ENV.hostname}{WEBHOOK_PATH}"
+
+# Telegram's cap on concurrent webhook connections (its default is 40)
+WEBHOOK_MAX_CONNECTIONS = 100
+
+# Only the update types the command and text handlers can act on
+WEBHOOK_ALLOWED_UPDATES = [Update.MESSAGE, Update.EDITED_MESSAGE]
+
+# Set in the environment by the Gunicorn master once it has registered the webhook
+WEBHOOK_REGISTERED_ENV = "WEBHOOK_REGISTERED"
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,13 +72,66 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Flask app
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Quart app (ASGI), served on the same event loop as the bot
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 
 # Global bot components
 bot_application = None
 bot_instance = None
 
+# Queue of raw webhook payloads, created per worker in startup()
+update_batcher = None
+
+# Set once the bot is started and the webhook is registered with Telegram.
+# Built at import, so a preloading Gunicorn master creates it too; this is safe
+# because asyncio primitives bind to a loop on first use (Python 3.10+)
+bot_ready = asyncio.Event()
+
+# Seconds to allow for the Telegram start-up calls, and for a request to wait on readiness
+STARTUP_TIMEOUT = 30
+READY_WAIT_TIMEOUT = 5
+
+# Pre-serialized health responses; Render polls /health constantly
+JSON_HEADERS = {'Content-Type': 'application/json'}
+HEALTHY_BODY = b'{"status":"healthy","bot_initialized":true}'
+NOT_READY_BODY = b'{"status":"starting","bot_initialized":false}'
+
+async def register_webhook(bot: Bot):
+    """Point Telegram at this server's webhook URL."""
+    # Updates queued while we were down are stale by now, so drop them
+    await bot.set_webhook(
+        url=WEBHOOK_URL,
+        max_connections=WEBHOOK_MAX_CONNECTIONS,
+        drop_pending_updates=True,
+        allowed_updates=WEBHOOK_ALLOWED_UPDATES
+    )
+    logger.info(f"🔗 Webhook URL: {WEBHOOK_URL}")
+
+def register_webhook_once():
+    """Register the webhook from the Gunicorn master so forked workers skip it."""
+    async def register():
+        async with Bot(ENV.token) as bot:
+            await register_webhook(bot)
+    
+    try:
+        asyncio.run(register())
+    except Exception:
+        # Leave the flag unset so each worker registers the webhook itself
+        logger.exception("❌ Webhook registration failed in the Gunicorn master, workers will retry")
+        return
+    
+    os.environ[WEBHOOK_REGISTERED_ENV] = "1"
+
 async def initialize_bot():
     """Initialize the bot components."""
     global bot_application, bot_instance
@@ -38,17 +139,9 @@ async def initialize_bot():
     try:
         logger.info("🚀 Initializing Telegram Word Game Bot...")
         
-        # Import components
-        from bot.config import BotConfig
-        from bot.models import GameConfig
-        from bot.validators import create_word_validator
-        from bot.game_manager import GameManager
-        from bot.telegram_bot import create_telegram_bot
-        
-        # Create configuration
-        config = BotConfig()
-        config.validate()
-        logger.info(f"✅ Configuration loaded - Token: {config.telegram_bot_token[:10]}...")
+        # Validate configuration
+        bot_config.validate()
+        logger.info("✅ Configuration loaded")
         
         # Create game configuration
         game_config = GameConfig.from_env()
@@ -56,7 +149,7 @@ async def initialize_bot():
         
         # Create word validator
         logger.info("🔍 Initializing word validator...")
-        word_validator = create_word_validator(config.wordnik_api_key)
+        word_validator = create_word_validator(bot_config.wordnik_api_key)
         
         # Test validator
         validator_available = await word_validator.is_service_available()
@@ -71,80 +164,100 @@ async def initialize_bot():
         bot_instance = create_telegram_bot(game_manager)
         bot_application = bot_instance.setup_application()
         
-        # Initialize the application
-        await bot_application.initialize()
-        await bot_application.start()
+        # Only the Telegram calls are bounded; the validator check above may
+        # download NLTK data on a fresh container and takes as long as it takes
+        await asyncio.wait_for(start_application(), timeout=STARTUP_TIMEOUT)
+        bot_ready.set()
         
-        # Set webhook URL
-        webhook_url = f"https://{os.getenv('RENDER_EXTERNAL_HOSTNAME', 'localhost')}/{os.getenv('TELEGRAM_BOT_TOKEN')}"
-        await bot_application.bot.set_webhook(url=webhook_url)
+        logger.info("🎉 Bot initialized!")
         
-        logger.info(f"🎉 Bot initialized! Webhook URL: {webhook_url}")
-        
-    except Exception as e:
-        logger.error(f"❌ Bot initialization failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Bot initialization failed")
         raise
 
+async def start_application():
+    """Start the Telegram application and register the webhook if still needed."""
+    await bot_application.initialize()
+    await bot_application.start()
+    
+    # Set webhook URL, unless the Gunicorn master already did
+    if os.getenv(WEBHOOK_REGISTERED_ENV):
+        logger.info("🔗 Webhook already registered by the Gunicorn master")
+    else:
+        await register_webhook(bot_application.bot)
+
+async def handle_update(update_data: dict):
+    """Decode one raw update and hand it to the bot."""
+    update = Update.de_json(update_data, bot_application.bot)
+    await bot_application.process_update(update)
+
+@app.before_serving
+async def startup():
+    """Initialize the bot on the server's event loop before accepting requests."""
+    global update_batcher
+    loop = asyncio.get_running_loop()
+    logger.info(f"🔁 Event loop: {type(loop).__module__}.{type(loop).__name__}")
+    
+    # Small batches keep tail latency bounded while amortizing dispatch overhead
+    update_batcher = UpdateBatcher(
+        handle_update,
+        max_queue=ENV.queue_size,
+        batch_size=ENV.batch_size,
+        batch_window=ENV.batch_window,
+        max_inflight=ENV.max_inflight
+    )
+    await initialize_bot()
+    update_batcher.start()
+
+@app.after_serving
+async def shutdown():
+    """Stop the bot application when the server shuts down."""
+    bot_ready.clear()
+    
+    # Updates already answered with 200 will not be redelivered, so finish them first
+    if update_batcher:
+        await update_batcher.stop()
+    if bot_application:
+        await bot_application.stop()
+        await bot_application.shutdown()
+
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint for Render."""
-    return jsonify({
-        'status': 'healthy',
-        'bot_initialized': bot_application is not None
-    })
+    if bot_ready.is_set():
+        return HEALTHY_BODY, 200, JSON_HEADERS
+    return NOT_READY_BODY, 503, JSON_HEADERS
 
-@app.route(f"/{os.getenv('TELEGRAM_BOT_TOKEN')}", methods=['POST'])
-def webhook():
+@app.route(WEBHOOK_PATH, methods=['POST'])
+async def webhook():
     """Handle incoming webhook updates from Telegram."""
     try:
-        if not bot_application:
-            logger.error("Bot not initialized")
-            return "Bot not ready", 503
-        
-        # Get the update from Telegram
-        update_data = request.get_json(force=True)
-        update = Update.de_json(update_data, bot_application.bot)
+        if not bot_ready.is_set():
+            try:
+                await asyncio.wait_for(bot_ready.wait(), timeout=READY_WAIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.error("Bot not initialized")
+                return "Bot not ready", 503
         
-        # Process the update asynchronously
-        asyncio.create_task(bot_application.process_update(update))
+        # Get the update from Telegram and queue it for the batch consumer
+        update_data = orjson.loads(await request.get_data(cache=False))
+        if not update_batcher.submit(update_data):
+            logger.warning("Update queue full or stopping, asking Telegram to retry")
+            return "Too many updates", 429
         
         return "OK"
     
-    except Exception as e:
-        logger.error(f"Error processing webhook: {e}")
+    except Exception:
+        logger.exception("Error processing webhook")
         return "Error", 500
 
 @app.route('/', methods=['GET'])
-def root():
+async def root():
     """Root endpoint."""
     return jsonify({
         'message': 'Telegram Word Game Bot is running!',
         'status': 'active'
     })
 
-def run_bot_initialization():
-    """Run bot initialization in a separate thread."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(initialize_bot())
-    except Exception as e:
-        logger.error(f"Failed to initialize bot: {e}")
-        sys.exit(1)
-
 if __name__ == '__main__':
-    # Initialize bot in a separate thread
-    bot_thread = threading.Thread(target=run_bot_initialization)
-    bot_thread.daemon = True
-    bot_thread.start()
-    
-    # Wait for bot to initialize
-    import time
-    time.sleep(5)
-    
-    # Start Flask app
-    port = int(os.getenv('PORT', 10000))
-    logger.info(f"🌐 Starting Flask server on port {port}")
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    raise SystemExit("run via: gunicorn -c gunicorn.conf.py webhook_bot:app")